@@ -22,8 +22,8 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 Regular expression based date parsing
 '''
 from abc import abstractmethod, ABC
-from calendar import monthrange
-from collections import namedtuple
+from functools import lru_cache, partial
+from typing import NamedTuple
 import calendar
 import datetime
 import re
@@ -31,17 +31,42 @@ import re
 import dateparser
 
 
-ABBREV_MONTH_WORDS = list(calendar.month_abbr)
+MONTH_NAMES = tuple(calendar.month_name)
+MONTH_NUMBERS = {abbr.lower(): number for number, abbr in enumerate(calendar.month_abbr) if abbr}
+DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def get_days_in_month(year: int, month: int) -> int:
+    ''' Get the number of days in the month of the year, accounting for leap
+    years. Equivalent to calendar.monthrange(year, month)[1]
+    '''
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return DAYS_IN_MONTH[month]
+
+
+# The first and last day of the years most archival dates fall in
+YEAR_BOUNDS = {
+    year: (datetime.date(year, 1, 1), datetime.date(year, 12, 31))
+    for year in range(1800, datetime.date.today().year + 1)
+}
+# The first and last day of each month in those years
+MONTH_BOUNDS = {
+    (year, month): (datetime.date(year, month, 1),
+                    datetime.date(year, month, get_days_in_month(year, month)))
+    for year in YEAR_BOUNDS for month in range(1, 13)
+}
 
 
 class UnknownDateFormat(Exception):
     ''' Raised when a date cannot be parsed '''
 
 
-EventDate = namedtuple('EventDate', 'date,start,end')
-EventDate.__doc__ = (
-    'Represents a complete AtoM eventDate, with a start and end range'
-)
+class EventDate(NamedTuple):
+    ''' Represents a complete AtoM eventDate, with a start and end range '''
+    date: str
+    start: datetime.date
+    end: datetime.date
 
 
 DELIM = r'[-—\./]'
@@ -51,10 +76,12 @@ UNKNOWN_PORTION = r'(?:00|[Xx]{1,2}|\*+|\?+)'
 DECADE_NUM = r'(?P<%s>[1-2]\d{2})(?:-|—|_|0[\'❜’]?s)'
 YEAR_NUM = r'(?P<%s>[1-2]\d{3})'
 MONTH_NUM = r'(?P<%s>1[0-2]|0?[1-9])'
+# The longest spelling of each month is tried first, and no alternative can
+# match the empty string, so there is only one way to match each month word
 MONTH_NAME = (
-    r'(?P<%s>jan(?:\.?|uary)?|feb(?:\.?|ruary)?|mar(?:\.?|ch)?|apr(?:\.?|il)?|'
-    r'may\.?|jun(?:\.?|e)?|jul(?:\.?|y)?|aug(?:\.?|ust)?|sep(?:\.?|t\.?|tember)?|'
-    r'oct(?:\.?|ober)?|nov(?:\.?|ember)?|dec(?:\.?|ember)?)'
+    r'(?P<%s>jan(?:uary|\.)?|feb(?:ruary|\.)?|mar(?:ch|\.)?|apr(?:il|\.)?|'
+    r'may\.?|jun(?:e|\.)?|jul(?:y|\.)?|aug(?:ust|\.)?|sep(?:tember|t\.?|\.)?|'
+    r'oct(?:ober|\.)?|nov(?:ember|\.)?|dec(?:ember|\.)?)'
 )
 DATE_NUM = r'(?P<%s>3[0-1]|[1-2][0-9]|0?[1-9])'
 
@@ -62,14 +89,45 @@ PERMISSIVE_YEAR_DATE = (
     YEAR_NUM + '(?:' + DELIM + UNKNOWN_PORTION + DELIM + UNKNOWN_PORTION + ')?'
 )
 
+# Fragments shared by more than one handler. Substitute a tuple of group names,
+# one for each %s in the fragment
+YEAR_MONTH_DATE = YEAR_NUM + DELIM + MONTH_NUM + DELIM + DATE_NUM
+YEAR_MONTH_UNKNOWN_DATE = YEAR_NUM + DELIM + MONTH_NUM + DELIM + UNKNOWN_PORTION
+MONTH_NAME_DATE_YEAR = MONTH_NAME + r'\s*' + DATE_NUM + r'(?:,\s*|\s+)' + YEAR_NUM
+
+# Two digit strings for the numbers 0 to 31, for formatting months and days
+ZERO_PADDED = tuple(f'{number:02d}' for number in range(32))
+
+# Used to recognize numeric dates without a regex
+DELIM_CHARS = '-—./'
+RANGE_DELIM_CHARS = '-—'
+TWO_DIGIT_MONTHS = frozenset(ZERO_PADDED[1:13])
+TWO_DIGIT_DATES = frozenset(ZERO_PADDED[1:32])
+
+
+def get_year_bounds(year: int) -> tuple:
+    ''' Get the first and last day of the year
+    '''
+    bounds = YEAR_BOUNDS.get(year)
+    if bounds is None:
+        return datetime.date(year, 1, 1), datetime.date(year, 12, 31)
+    return bounds
+
+
+def get_month_bounds(year: int, month: int) -> tuple:
+    ''' Get the first and last day of the month of the year
+    '''
+    bounds = MONTH_BOUNDS.get((year, month))
+    if bounds is None:
+        return (datetime.date(year, month, 1),
+                datetime.date(year, month, get_days_in_month(year, month)))
+    return bounds
+
 
-def has_group(match, group):
-    ''' Determine if a regex match has the specified group
+def is_year(string: str) -> bool:
+    ''' Determine if a four character string matches YEAR_NUM
     '''
-    try:
-        return bool(match.group(group))
-    except IndexError:
-        return False
+    return string[0] in '12' and string[1:].isdecimal()
 
 
 def anchor(regex_string: str) -> str:
@@ -89,6 +147,42 @@ def anchor(regex_string: str) -> str:
     return '^' + regex_string + '$'
 
 
+def combine_regexes(handlers, lowercase: bool = False) -> tuple:
+    ''' Combine the REGEXES of each of the RegexDateHandler classes into a
+    single alternation. Each regex becomes a branch in a group named after its
+    handler, and the named groups inside of it are prefixed with that branch's
+    name so they do not collide with any other branch.
+
+    If lowercase is True, the combined regex is case-sensitive and must be
+    matched against lowercased dates. All of the REGEXES must then be
+    case-insensitive, with their letters written in lowercase.
+
+    Returns:
+        (tuple): The combined compiled regex, and a list of (branch name,
+            handler class, group numbers) tuples, one per branch
+    '''
+    branch_patterns = []
+    branch_handlers = []
+    for handler in handlers:
+        for index, regex in enumerate(handler.REGEXES):
+            branch = f'{handler.__name__}_{index}'
+            pattern = re.sub(r'\(\?P<(\w+)>', rf'(?P<{branch}_\1>', regex.pattern)
+            if lowercase:
+                if not regex.flags & re.IGNORECASE:
+                    raise ValueError(f'{handler.__name__} has a case-sensitive regex')
+            elif regex.flags & re.IGNORECASE:
+                pattern = f'(?i:{pattern})'
+            branch_patterns.append(f'(?P<{branch}>{pattern})')
+            branch_handlers.append((branch, handler))
+
+    combined = re.compile('|'.join(branch_patterns))
+    branches = [
+        (branch, handler, tuple(combined.groupindex[f'{branch}_{g}'] for g in handler.GROUPS))
+        for branch, handler in branch_handlers
+    ]
+    return combined, branches
+
+
 class DateHandler(ABC):
     @abstractmethod
     def handle(self, date: str) -> EventDate:
@@ -116,6 +210,36 @@ class BaseDateHandler(DateHandler):
         raise UnknownDateFormat('Could not handle date "{}"'.format(date))
 
 
+class RegexDateHandler(BaseDateHandler):
+    ''' Handle dates that match any one of the anchored REGEXES. The whole
+    matched date and the values of the named GROUPS (in order) are passed to
+    build() to create the EventDate.
+    '''
+
+    REGEXES = ()
+    GROUPS = ()
+    # Whether the REGEXES can match dates that start with a digit, and dates
+    # that start with anything else
+    DIGIT_FIRST = True
+    OTHER_FIRST = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Match all of the REGEXES at once, instead of trying each of them in turn
+        cls.REGEX, branches = combine_regexes([cls])
+        cls.BRANCH_GROUPS = {branch: groups for branch, _, groups in branches}
+
+    def handle(self, date: str) -> EventDate:
+        match_obj = self.REGEX.match(date)
+        if match_obj is None:
+            return super().handle(date)
+        return self.build(*match_obj.group(0, *self.BRANCH_GROUPS[match_obj.lastgroup]))
+
+    @abstractmethod
+    def build(self, date: str, *groups: str) -> EventDate:
+        pass
+
+
 class UnknownDateHandler(BaseDateHandler):
     ''' Handle unknown dates by returning the configured unknown date
     '''
@@ -132,12 +256,20 @@ class UnknownDateHandler(BaseDateHandler):
         self.unknown_end_date = unknown_end_date
 
     def handle(self, date: str) -> EventDate:
+        # NO_DATE can only match a date starting with a digit if it starts with 0 or 9, or has at
+        # most two digits in a row at the start. Skip the regex for other dates, like 1999-09-01
+        if len(date) > 2 and date[0] in '12345678' and date[2].isdecimal():
+            return super().handle(date)
+        # It can only match a date longer than three characters that ends in a digit if it starts
+        # with 0, 9, [ or unknown. Skip the regex for other dates, like Spring 2002
+        if len(date) > 3 and date[-1].isdecimal() and date[0] not in '09[uU':
+            return super().handle(date)
         if self.NO_DATE.match(date) is not None:
             return EventDate(self.unknown_date, self.unknown_start_date, self.unknown_end_date)
         return super().handle(date)
 
 
-class YearRangeHandler(BaseDateHandler):
+class YearRangeHandler(RegexDateHandler):
     ''' Handle dates like:
 
     2000 to 2005
@@ -153,18 +285,10 @@ class YearRangeHandler(BaseDateHandler):
         (YEAR_NUM % 'first_year') + RANGE_DELIM + r'(?P<second_year>\d{2})'
     ))
 
-    def handle(self, date: str) -> EventDate:
-        match_obj = None
-        for regex in (self.YEAR_RANGE, self.ABBREV_YEAR_RANGE):
-            match_obj = regex.match(date)
-            if match_obj is not None:
-                break
-
-        if match_obj is None:
-            return super().handle(date)
+    REGEXES = (YEAR_RANGE, ABBREV_YEAR_RANGE)
+    GROUPS = ('first_year', 'second_year')
 
-        first_year = match_obj.group('first_year')
-        second_year = match_obj.group('second_year')
+    def build(self, date: str, first_year: str, second_year: str) -> EventDate:
         if len(second_year) == 2:
             second_year = f'{first_year[0:2]}{second_year}'
         first_year_num = int(first_year)
@@ -176,12 +300,12 @@ class YearRangeHandler(BaseDateHandler):
             first_year, second_year = second_year, first_year
 
         event_date = first_year if first_year_num == second_year_num else f'{first_year} - {second_year}'
-        early_date = datetime.date(first_year_num, 1, 1)
-        late_date = datetime.date(second_year_num, 12, 31)
+        early_date = get_year_bounds(first_year_num)[0]
+        late_date = get_year_bounds(second_year_num)[1]
         return EventDate(event_date, early_date, late_date)
 
 
-class YearMonthDayHandler(BaseDateHandler):
+class YearMonthDayHandler(RegexDateHandler):
     ''' Handle dates like:
 
     1999-09-01
@@ -190,7 +314,7 @@ class YearMonthDayHandler(BaseDateHandler):
     '''
 
     YYYY_MM_DD = re.compile(anchor(
-        (YEAR_NUM % 'year') + DELIM + (MONTH_NUM % 'month') + DELIM + (DATE_NUM % 'date')
+        YEAR_MONTH_DATE % ('year', 'month', 'date')
     ))
 
     MM_DD_YYYY = re.compile(anchor(
@@ -201,32 +325,24 @@ class YearMonthDayHandler(BaseDateHandler):
         (DATE_NUM % 'date') + DELIM + (MONTH_NUM % 'month') + DELIM + (YEAR_NUM % 'year')
     ))
 
-    def handle(self, date: str):
-        match_obj = None
-        for regex in (self.YYYY_MM_DD, self.MM_DD_YYYY, self.DD_MM_YYYY):
-            match_obj = regex.match(date)
-            if match_obj is not None:
-                break
-        if match_obj is None:
-            return super().handle(date)
+    REGEXES = (YYYY_MM_DD, MM_DD_YYYY, DD_MM_YYYY)
+    GROUPS = ('year', 'month', 'date')
 
-        year = match_obj.group('year')
-        month = match_obj.group('month')
-        day = match_obj.group('date')
+    def build(self, date: str, year: str, month: str, day: str) -> EventDate:
         year_num = int(year)
         month_num = int(month)
         day_num = int(day)
 
-        days_in_month = monthrange(year_num, month_num)[1]
+        days_in_month = get_days_in_month(year_num, month_num)
         if day_num > days_in_month:
             day_num = days_in_month
 
-        event_date = f"{year}-{month.rjust(2, '0')}-{str(day_num).rjust(2, '0')}"
+        event_date = f'{year}-{ZERO_PADDED[month_num]}-{ZERO_PADDED[day_num]}'
         exact_date = datetime.date(year_num, month_num, day_num)
         return EventDate(event_date, exact_date, exact_date)
 
 
-class YearMonthRangeHandler(BaseDateHandler):
+class YearMonthRangeHandler(RegexDateHandler):
     ''' Handle dates like:
 
     2009-05-00 to 2010-02-00
@@ -235,34 +351,29 @@ class YearMonthRangeHandler(BaseDateHandler):
     '''
 
     YEAR_MONTH_RANGE = re.compile(anchor(
-        (YEAR_NUM % 'year_1') + DELIM + (MONTH_NUM % 'month_1') + DELIM + UNKNOWN_PORTION + \
+        (YEAR_MONTH_UNKNOWN_DATE % ('year_1', 'month_1')) + \
         RANGE_DELIM + \
-        (YEAR_NUM % 'year_2') + DELIM + (MONTH_NUM % 'month_2') + DELIM + UNKNOWN_PORTION
+        (YEAR_MONTH_UNKNOWN_DATE % ('year_2', 'month_2'))
     ))
 
-    def handle(self, date: str):
-        match_obj = self.YEAR_MONTH_RANGE.match(date)
-        if match_obj is None:
-            return super().handle(date)
+    REGEXES = (YEAR_MONTH_RANGE,)
+    GROUPS = ('year_1', 'month_1', 'year_2', 'month_2')
 
-        first_year = match_obj.group('year_1')
-        first_month = match_obj.group('month_1')
+    def build(self, date: str, first_year: str, first_month: str, second_year: str,
+              second_month: str) -> EventDate:
         first_month_number = int(first_month)
-        first_month_name = calendar.month_name[first_month_number]
+        first_month_name = MONTH_NAMES[first_month_number]
 
-        second_year = match_obj.group('year_2')
-        second_month = match_obj.group('month_2')
         second_month_number = int(second_month)
-        second_month_name = calendar.month_name[second_month_number]
-        days_in_second_month = monthrange(int(second_year), second_month_number)[1]
+        second_month_name = MONTH_NAMES[second_month_number]
 
         event_date = f'{first_month_name} {first_year} - {second_month_name} {second_year}'
-        early_date = datetime.date(int(first_year), first_month_number, 1)
-        late_date = datetime.date(int(second_year), second_month_number, days_in_second_month)
+        early_date = get_month_bounds(int(first_year), first_month_number)[0]
+        late_date = get_month_bounds(int(second_year), second_month_number)[1]
         return EventDate(event_date, early_date, late_date)
 
 
-class YearMonthDayRangeHandler(BaseDateHandler):
+class YearMonthDayRangeHandler(RegexDateHandler):
     ''' Handle dates like:
 
     2009-05-20 to 2008-09-16
@@ -270,31 +381,27 @@ class YearMonthDayRangeHandler(BaseDateHandler):
     '''
 
     YEAR_MONTH_DAY_RANGE = re.compile(anchor(
-        (YEAR_NUM % 'year_1') + DELIM + (MONTH_NUM % 'month_1') + DELIM + (DATE_NUM % 'date_1') + \
+        (YEAR_MONTH_DATE % ('year_1', 'month_1', 'date_1')) + \
         RANGE_DELIM + \
-        (YEAR_NUM % 'year_2') + DELIM + (MONTH_NUM % 'month_2') + DELIM + (DATE_NUM % 'date_2')
+        (YEAR_MONTH_DATE % ('year_2', 'month_2', 'date_2'))
     ))
 
-    def handle(self, date: str) -> EventDate:
-        match_obj = self.YEAR_MONTH_DAY_RANGE.match(date)
-        if match_obj is None:
-            return super().handle(date)
+    REGEXES = (YEAR_MONTH_DAY_RANGE,)
+    GROUPS = ('year_1', 'month_1', 'date_1', 'year_2', 'month_2', 'date_2')
 
-        first_year = match_obj.group('year_1')
-        first_month = match_obj.group('month_1')
+    def build(self, date: str, first_year: str, first_month: str, first_date: str,
+              second_year: str, second_month: str, second_date: str) -> EventDate:
         first_month_num = int(first_month)
-        first_month_name = calendar.month_name[first_month_num]
-        days_in_first_month = monthrange(int(first_year), first_month_num)[1]
-        first_date_num = int(match_obj.group('date_1'))
+        first_month_name = MONTH_NAMES[first_month_num]
+        days_in_first_month = get_days_in_month(int(first_year), first_month_num)
+        first_date_num = int(first_date)
         if first_date_num > days_in_first_month:
             first_date_num = days_in_first_month
 
-        second_year = match_obj.group('year_2')
-        second_month = match_obj.group('month_2')
         second_month_num = int(second_month)
-        second_month_name = calendar.month_name[second_month_num]
-        days_in_second_month = monthrange(int(second_year), second_month_num)[1]
-        second_date_num = int(match_obj.group('date_2'))
+        second_month_name = MONTH_NAMES[second_month_num]
+        days_in_second_month = get_days_in_month(int(second_year), second_month_num)
+        second_date_num = int(second_date)
         if second_date_num > days_in_second_month:
             second_date_num = days_in_second_month
 
@@ -302,9 +409,7 @@ class YearMonthDayRangeHandler(BaseDateHandler):
         late_date = datetime.date(int(second_year), second_month_num, second_date_num)
 
         if early_date == late_date:
-            first_month = str(first_month_num).rjust(2, '0')
-            first_date = str(first_date_num).rjust(2, '0')
-            event_date = f'{first_year}-{first_month}-{first_date}'
+            event_date = f'{first_year}-{ZERO_PADDED[first_month_num]}-{ZERO_PADDED[first_date_num]}'
             date_range = [early_date, early_date]
         elif early_date < late_date:
             event_date = (f'{first_month_name} {first_date_num}, {first_year} - '
@@ -318,7 +423,7 @@ class YearMonthDayRangeHandler(BaseDateHandler):
         return EventDate(event_date, *date_range)
 
 
-class ZeroMonthHandler(BaseDateHandler):
+class ZeroMonthHandler(RegexDateHandler):
     ''' Handle dates like:
 
     2005-00-01
@@ -328,44 +433,38 @@ class ZeroMonthHandler(BaseDateHandler):
         (YEAR_NUM % 'year') + DELIM + UNKNOWN_PORTION + DELIM + (DATE_NUM % 'date')
     ))
 
-    def handle(self, date: str):
-        match_obj = self.ZERO_MONTH.match(date)
-        if match_obj is None:
-            return super().handle(date)
+    REGEXES = (ZERO_MONTH,)
+    GROUPS = ('year',)
 
-        year = match_obj.group('year')
+    def build(self, date: str, year: str) -> EventDate:
         year_num = int(year)
-        early_date = datetime.date(year_num, 1, 1)
-        late_date = datetime.date(year_num, 12, 31)
+        early_date, late_date = get_year_bounds(year_num)
         return EventDate(year, early_date, late_date)
 
 
-class ZeroDayHandler(BaseDateHandler):
+class ZeroDayHandler(RegexDateHandler):
     ''' Handle dates like:
 
     2021-06-XX
     '''
 
     ZERO_DAY = re.compile(anchor(
-        (YEAR_NUM % 'year') + DELIM + (MONTH_NUM % 'month') + DELIM + UNKNOWN_PORTION
+        YEAR_MONTH_UNKNOWN_DATE % ('year', 'month')
     ))
 
-    def handle(self, date: str):
-        match_obj = self.ZERO_DAY.match(date)
-        if match_obj is None:
-            return super().handle(date)
+    REGEXES = (ZERO_DAY,)
+    GROUPS = ('year', 'month')
 
-        year = int(match_obj.group('year'))
-        month_number = int(match_obj.group('month'))
-        days_in_month = monthrange(year, month_number)[1]
-        month_name = calendar.month_name[month_number]
+    def build(self, date: str, year: str, month: str) -> EventDate:
+        year = int(year)
+        month_number = int(month)
+        month_name = MONTH_NAMES[month_number]
 
-        early_date = datetime.date(year, month_number, 1)
-        late_date = datetime.date(year, month_number, days_in_month)
+        early_date, late_date = get_month_bounds(year, month_number)
         return EventDate(f'{month_name} {year}', early_date, late_date)
 
 
-class DecadeHandler(BaseDateHandler):
+class DecadeHandler(RegexDateHandler):
     ''' Handle dates like:
 
     Early 190-
@@ -377,29 +476,28 @@ class DecadeHandler(BaseDateHandler):
         (DECADE_NUM % 'decade')
     ), flags=re.IGNORECASE)
 
-    def handle(self, date: str):
-        match_obj = self.DECADE.match(date)
-        if match_obj is None:
-            return super().handle(date)
+    REGEXES = (DECADE,)
+    GROUPS = ('span', 'decade')
+    OTHER_FIRST = True
 
-        decade = match_obj.group('decade')
-        span = match_obj.group('span').lower() if has_group(match_obj, 'span') else None
+    def build(self, date: str, span: str, decade: str) -> EventDate:
+        span = span.lower() if span else None
 
         if span is None:
-            early_date = datetime.date(int(f'{decade}0'), 1, 1)
-            late_date = datetime.date(int(f'{decade}9'), 12, 31)
+            early_date = get_year_bounds(int(f'{decade}0'))[0]
+            late_date = get_year_bounds(int(f'{decade}9'))[1]
         elif span == 'late':
-            early_date = datetime.date(int(f'{decade}7'), 1, 1)
-            late_date = datetime.date(int(f'{decade}9'), 12, 31)
+            early_date = get_year_bounds(int(f'{decade}7'))[0]
+            late_date = get_year_bounds(int(f'{decade}9'))[1]
         elif span == 'early':
-            early_date = datetime.date(int(f'{decade}0'), 1, 1)
-            late_date = datetime.date(int(f'{decade}3'), 12, 31)
+            early_date = get_year_bounds(int(f'{decade}0'))[0]
+            late_date = get_year_bounds(int(f'{decade}3'))[1]
         else:
             raise UnknownDateFormat('Could not handle decade date "{}"'.format(date))
         return EventDate(f'{decade}0s', early_date, late_date)
 
 
-class DecadeRangeHandler(BaseDateHandler):
+class DecadeRangeHandler(RegexDateHandler):
     ''' Handle dates like:
 
     1930s - 1940s
@@ -411,23 +509,19 @@ class DecadeRangeHandler(BaseDateHandler):
         (DECADE_NUM % 'decade_2')
     ), flags=re.IGNORECASE)
 
-    def handle(self, date: str):
-        match_obj = self.DECADE_RANGE.match(date)
-        if match_obj is None:
-            return super().handle(date)
-
-        decade_1 = match_obj.group('decade_1')
-        decade_2 = match_obj.group('decade_2')
+    REGEXES = (DECADE_RANGE,)
+    GROUPS = ('decade_1', 'decade_2')
 
+    def build(self, date: str, decade_1: str, decade_2: str) -> EventDate:
         if int(decade_1) > int(decade_2):
             decade_1, decade_2 = decade_2, decade_1
 
-        early_date = datetime.date(int(f'{decade_1}0'), 1, 1)
-        late_date = datetime.date(int(f'{decade_2}9'), 12, 31)
+        early_date = get_year_bounds(int(f'{decade_1}0'))[0]
+        late_date = get_year_bounds(int(f'{decade_2}9'))[1]
         return EventDate(f'{decade_1}0 - {decade_2}9', early_date, late_date)
 
 
-class YearHandler(BaseDateHandler):
+class YearHandler(RegexDateHandler):
     ''' Handle dates like:
 
     2017
@@ -438,19 +532,16 @@ class YearHandler(BaseDateHandler):
         PERMISSIVE_YEAR_DATE % 'year'
     ))
 
-    def handle(self, date: str):
-        match_obj = self.YYYY.match(date)
-        if match_obj is None:
-            return super().handle(date)
+    REGEXES = (YYYY,)
+    GROUPS = ('year',)
 
-        year = match_obj.group('year')
+    def build(self, date: str, year: str) -> EventDate:
         year_num = int(year)
-        early_date = datetime.date(year_num, 1, 1)
-        late_date = datetime.date(year_num, 12, 31)
+        early_date, late_date = get_year_bounds(year_num)
         return EventDate(year, early_date, late_date)
 
 
-class SeasonHandler(BaseDateHandler):
+class SeasonHandler(RegexDateHandler):
     ''' Handle (English) dates like:
 
     Spring 2002
@@ -461,51 +552,43 @@ class SeasonHandler(BaseDateHandler):
         (YEAR_NUM % 'year')
     ), flags=re.IGNORECASE)
 
-    def handle(self, date: str):
-        match_obj = self.SEASON.match(date)
-        if match_obj is None:
-            return super().handle(date)
-
-        season = match_obj.group('season').lower()
-        year = int(match_obj.group('year'))
-
-        if season == 'early':
-            early_date = datetime.date(year, 1, 1)
-            # The following handles leap years
-            late_date = datetime.date(year, 2, monthrange(year, 2)[1])
-        elif season == 'spring':
-            early_date = datetime.date(year, 3, 1)
-            late_date = datetime.date(year, 5, 31)
-        elif season == 'easter':
-            early_date = datetime.date(year, 4, 1)
-            late_date = datetime.date(year, 4, 30)
-        elif season == 'summer':
-            early_date = datetime.date(year, 6, 1)
-            late_date = datetime.date(year, 8, 31)
-        elif season == 'fall':
-            early_date = datetime.date(year, 9, 1)
-            late_date = datetime.date(year, 11, 30)
-        elif season == 'winter':
-            early_date = datetime.date(year, 12, 1)
-            # The following handles leap years
-            next_year = year + 1
-            days_in_month = monthrange(next_year, 2)[1]
-            late_date = datetime.date(next_year, 2, days_in_month)
-        elif season == 'christmas':
-            early_date = datetime.date(year, 12, 20)
-            late_date = datetime.date(year, 12, 31)
-        elif season == 'late':
-            early_date = datetime.date(year, 11, 1)
-            late_date = datetime.date(year, 12, 31)
-        elif season == 'year end':
-            early_date = datetime.date(year, 12, 1)
-            late_date = datetime.date(year, 12, 31)
-        else:
+    REGEXES = (SEASON,)
+    GROUPS = ('season', 'year')
+    DIGIT_FIRST = False
+    OTHER_FIRST = True
+
+    # (start month, start day, years until end, end month, end day). An end day of None is the
+    # last day of the end month
+    SEASONS = {
+        'early': (1, 1, 0, 2, None),
+        'spring': (3, 1, 0, 5, 31),
+        'easter': (4, 1, 0, 4, 30),
+        'summer': (6, 1, 0, 8, 31),
+        'fall': (9, 1, 0, 11, 30),
+        'winter': (12, 1, 1, 2, None),
+        'christmas': (12, 20, 0, 12, 31),
+        'late': (11, 1, 0, 12, 31),
+        'year end': (12, 1, 0, 12, 31),
+    }
+
+    def build(self, date: str, season: str, year: str) -> EventDate:
+        season = season.lower()
+        year = int(year)
+
+        bounds = self.SEASONS.get(season)
+        if bounds is None:
             raise UnknownDateFormat('Could not handle seasonal date "{}"'.format(date))
+        start_month, start_day, end_year_offset, end_month, end_day = bounds
+        end_year = year + end_year_offset
+
+        early_date = datetime.date(year, start_month, start_day)
+        # The last day of the month handles leap years for seasons ending in February
+        late_date = datetime.date(end_year, end_month,
+                                  end_day or get_days_in_month(end_year, end_month))
         return EventDate(f'{season.capitalize()} {year}', early_date, late_date)
 
 
-class MonthWordYearHandler(BaseDateHandler):
+class MonthWordYearHandler(RegexDateHandler):
     ''' Handle (English) dates like:
 
     Late May 2003
@@ -516,37 +599,38 @@ class MonthWordYearHandler(BaseDateHandler):
         r'(?P<span>early|end of|late)?\s*'+ (MONTH_NAME % 'month_name') + r'\s*' + (YEAR_NUM % 'year')
     ), flags=re.IGNORECASE)
 
-    def handle(self, date: str):
-        match_obj = self.MONTH_WORD_YEAR.match(date)
-        if match_obj is None:
-            return super().handle(date)
+    REGEXES = (MONTH_WORD_YEAR,)
+    GROUPS = ('span', 'month_name', 'year')
+    DIGIT_FIRST = False
+    OTHER_FIRST = True
 
-        month_abbr = match_obj.group('month_name')[0:3]
-        month_number = ABBREV_MONTH_WORDS.index(month_abbr.capitalize())
-        month_name = calendar.month_name[month_number]
-        year = int(match_obj.group('year'))
-        days_in_month = monthrange(year, month_number)[1]
+    def build(self, date: str, span: str, month_word: str, year: str) -> EventDate:
+        month_abbr = month_word[0:3]
+        month_number = MONTH_NUMBERS[month_abbr.lower()]
+        month_name = MONTH_NAMES[month_number]
+        year = int(year)
+        first_day, last_day = get_month_bounds(year, month_number)
 
-        span = match_obj.group('span').lower() if has_group(match_obj, 'span') else None
+        span = span.lower() if span else None
 
         if span is None:
-            early_date = datetime.date(year, month_number, 1)
-            late_date = datetime.date(year, month_number, days_in_month)
+            early_date = first_day
+            late_date = last_day
         elif span == 'early':
-            early_date = datetime.date(year, month_number, 1)
+            early_date = first_day
             late_date = datetime.date(year, month_number, 10)
         elif span == 'end of':
             early_date = datetime.date(year, month_number, 16)
-            late_date = datetime.date(year, month_number, days_in_month)
+            late_date = last_day
         elif span == 'late':
             early_date = datetime.date(year, month_number, 21)
-            late_date = datetime.date(year, month_number, days_in_month)
+            late_date = last_day
         else:
             raise UnknownDateFormat('Could not handle month, year with span "{}"'.format(date))
         return EventDate(f'{month_name} {year}', early_date, late_date)
 
 
-class MonthWordDayYearHandler(BaseDateHandler):
+class MonthWordDayYearHandler(RegexDateHandler):
     ''' Handle (English) dates like:
 
     January 17, 2009
@@ -554,27 +638,25 @@ class MonthWordDayYearHandler(BaseDateHandler):
     '''
 
     MONTH_WORD_DAY_YEAR = re.compile(anchor(
-        (MONTH_NAME % 'month_name') + r'\s*' + \
-        (DATE_NUM % 'date') + r'(?:,\s*|\s+)' + \
-        (YEAR_NUM % 'year')
+        MONTH_NAME_DATE_YEAR % ('month_name', 'date', 'year')
     ), flags=re.IGNORECASE)
 
-    def handle(self, date: str):
-        match_obj = self.MONTH_WORD_DAY_YEAR.match(date)
-        if match_obj is None:
-            return super().handle(date)
+    REGEXES = (MONTH_WORD_DAY_YEAR,)
+    GROUPS = ('month_name', 'date', 'year')
+    DIGIT_FIRST = False
+    OTHER_FIRST = True
 
-        month_abbr = match_obj.group('month_name')[0:3]
-        month_number = ABBREV_MONTH_WORDS.index(month_abbr.capitalize())
-        year = match_obj.group('year')
-        date = match_obj.group('date')
+    def build(self, date: str, month_word: str, day: str, year: str) -> EventDate:
+        month_abbr = month_word[0:3]
+        month_number = MONTH_NUMBERS[month_abbr.lower()]
 
-        event_date = f'{year}-{str(month_number).rjust(2, "0")}-{date.rjust(2, "0")}'
-        exact_date = datetime.date(int(year), month_number, int(date))
+        day_num = int(day)
+        event_date = f'{year}-{ZERO_PADDED[month_number]}-{ZERO_PADDED[day_num]}'
+        exact_date = datetime.date(int(year), month_number, day_num)
         return EventDate(event_date, exact_date, exact_date)
 
 
-class DayMonthWordYearHandler(BaseDateHandler):
+class DayMonthWordYearHandler(RegexDateHandler):
     ''' Handle dates like:
 
     30-jan-19
@@ -589,65 +671,61 @@ class DayMonthWordYearHandler(BaseDateHandler):
         r'(?P<year>(?:[1-2]\d|[1-2]\d{3}))'
     ), flags=re.IGNORECASE)
 
-    def handle(self, date: str):
-        match_obj = self.DAY_MONTH_WORD_YEAR.match(date)
-        if match_obj is None:
-            return super().handle(date)
+    REGEXES = (DAY_MONTH_WORD_YEAR,)
+    GROUPS = ('date', 'month_name', 'year')
 
-        month_abbr = match_obj.group('month_name')[0:3]
-        month_number = ABBREV_MONTH_WORDS.index(month_abbr.capitalize())
-        year = match_obj.group('year')
+    def build(self, date: str, day: str, month_word: str, year: str) -> EventDate:
+        month_abbr = month_word[0:3]
+        month_number = MONTH_NUMBERS[month_abbr.lower()]
         if len(year) == 2:
             year = f'19{year}' # TODO: This is pretty naive, should be changed
-        date = match_obj.group('date')
 
-        event_date = f'{year}-{str(month_number).rjust(2, "0")}-{date.rjust(2, "0")}'
-        exact_date = datetime.date(int(year), month_number, int(date))
+        day_num = int(day)
+        event_date = f'{year}-{ZERO_PADDED[month_number]}-{ZERO_PADDED[day_num]}'
+        exact_date = datetime.date(int(year), month_number, day_num)
         return EventDate(event_date, exact_date, exact_date)
 
 
-class MonthWordDayYearRangeHandler(BaseDateHandler):
+class MonthWordDayYearRangeHandler(RegexDateHandler):
     ''' Handle dates like:
 
     September 29, 2002 to September 30, 2002
     '''
 
     MONTH_WORD_YEAR_RANGE = re.compile(anchor(
-        (MONTH_NAME % 'month_name_1') + r'\s*' + \
-        (DATE_NUM % 'date_1') + r'(?:,\s*|\s+)' + \
-        (YEAR_NUM % 'year_1') + \
+        (MONTH_NAME_DATE_YEAR % ('month_name_1', 'date_1', 'year_1')) + \
         RANGE_DELIM + \
-        (MONTH_NAME % 'month_name_2') + r'\s*' + \
-        (DATE_NUM % 'date_2') + r'(?:,\s*|\s+)' + \
-        (YEAR_NUM % 'year_2')
+        (MONTH_NAME_DATE_YEAR % ('month_name_2', 'date_2', 'year_2'))
     ), flags=re.IGNORECASE)
 
-    def handle(self, date: str):
-        match_obj = self.MONTH_WORD_YEAR_RANGE.match(date)
-        if match_obj is None:
-            return super().handle(date)
-
-        month_1_abbr = match_obj.group('month_name_1')[0:3]
-        month_1_num = ABBREV_MONTH_WORDS.index(month_1_abbr.capitalize())
-        month_1_name = calendar.month_name[month_1_num]
-        year_1_num = int(match_obj.group('year_1'))
-        days_in_month_1 = monthrange(year_1_num, month_1_num)[1]
-
-        if has_group(match_obj, 'date_1'):
-            day_1_num = int(match_obj.group('date_1')) or 1
+    REGEXES = (MONTH_WORD_YEAR_RANGE,)
+    GROUPS = ('month_name_1', 'date_1', 'year_1', 'month_name_2', 'date_2', 'year_2')
+    DIGIT_FIRST = False
+    OTHER_FIRST = True
+
+    def build(self, date: str, month_word_1: str, date_1: str, year_1: str,
+              month_word_2: str, date_2: str, year_2: str) -> EventDate:
+        month_1_abbr = month_word_1[0:3]
+        month_1_num = MONTH_NUMBERS[month_1_abbr.lower()]
+        month_1_name = MONTH_NAMES[month_1_num]
+        year_1_num = int(year_1)
+        days_in_month_1 = get_days_in_month(year_1_num, month_1_num)
+
+        if date_1:
+            day_1_num = int(date_1) or 1
             if day_1_num > days_in_month_1:
                 day_1_num = days_in_month_1
         else:
             day_1_num = 1
 
-        month_2_abbr = match_obj.group('month_name_2')[0:3]
-        month_2_num = ABBREV_MONTH_WORDS.index(month_2_abbr.capitalize())
-        month_2_name = calendar.month_name[month_2_num]
-        year_2_num = int(match_obj.group('year_2'))
-        days_in_month_2 = monthrange(year_2_num, month_2_num)[1]
+        month_2_abbr = month_word_2[0:3]
+        month_2_num = MONTH_NUMBERS[month_2_abbr.lower()]
+        month_2_name = MONTH_NAMES[month_2_num]
+        year_2_num = int(year_2)
+        days_in_month_2 = get_days_in_month(year_2_num, month_2_num)
 
-        if has_group(match_obj, 'date_2'):
-            day_2_num = int(match_obj.group('date_2')) or 1
+        if date_2:
+            day_2_num = int(date_2) or 1
             if day_2_num > days_in_month_2:
                 day_2_num = days_in_month_2
         else:
@@ -664,9 +742,7 @@ class MonthWordDayYearRangeHandler(BaseDateHandler):
             early_date, late_date = late_date, early_date
 
         if early_date == late_date:
-            month_str = str(month_1_num).rjust(2, '0')
-            day_str = str(day_1_num).rjust(2, '0')
-            event_date = f'{year_1_num}-{month_str}-{day_str}'
+            event_date = f'{year_1_num}-{ZERO_PADDED[month_1_num]}-{ZERO_PADDED[day_1_num]}'
         else:
             event_date = (f'{month_1_name} {day_1_num}, {year_1_num}'
                           ' - '
@@ -675,24 +751,155 @@ class MonthWordDayYearRangeHandler(BaseDateHandler):
         return EventDate(event_date, early_date, late_date)
 
 
+class CombinedRegexHandler(BaseDateHandler):
+    ''' Handle dates with the first of the HANDLERS that can handle them, using
+    one combined regular expression instead of trying each HANDLERS' regular
+    expressions in turn.
+    '''
+
+    HANDLERS = (
+        YearRangeHandler,
+        YearMonthDayHandler,
+        YearMonthRangeHandler,
+        YearMonthDayRangeHandler,
+        ZeroMonthHandler,
+        ZeroDayHandler,
+        DecadeHandler,
+        DecadeRangeHandler,
+        YearHandler,
+        SeasonHandler,
+        MonthWordYearHandler,
+        MonthWordDayYearHandler,
+        DayMonthWordYearHandler,
+        MonthWordDayYearRangeHandler,
+    )
+
+    # The first character of a date rules out most of the HANDLERS, so only
+    # the ones that can match it are combined
+    DIGIT_FIRST_COMBINED, DIGIT_FIRST_BRANCHES = combine_regexes(
+        [handler for handler in HANDLERS if handler.DIGIT_FIRST]
+    )
+    # These are all word dates, and are matched faster against the lowercased
+    # date than case-insensitively
+    OTHER_FIRST_COMBINED, OTHER_FIRST_BRANCHES = combine_regexes(
+        [handler for handler in HANDLERS if handler.OTHER_FIRST], lowercase=True
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.handlers = {handler: handler(*args, **kwargs) for handler in self.HANDLERS}
+        self.digit_first_builders = self._get_builders(self.DIGIT_FIRST_BRANCHES)
+        self.other_first_builders = self._get_builders(self.OTHER_FIRST_BRANCHES)
+
+    def _get_builders(self, branches) -> dict:
+        return {
+            branch: (self.handlers[handler].build, groups) for branch, handler, groups in branches
+        }
+
+    def handle(self, date: str) -> EventDate:
+        event_date = self._handle_numeric(date)
+        if event_date is not None:
+            return event_date
+        if '0' <= date[:1] <= '9':
+            match_obj = self.DIGIT_FIRST_COMBINED.match(date)
+            builders = self.digit_first_builders
+        else:
+            match_obj = self.OTHER_FIRST_COMBINED.match(date.lower())
+            builders = self.other_first_builders
+        if match_obj is None:
+            return super().handle(date)
+        build, groups = builders[match_obj.lastgroup]
+        return build(*match_obj.group(0, *groups))
+
+    def _handle_numeric(self, date: str):
+        ''' Handle the most common numeric dates without using a regex, using
+        the same handler that the combined regex would have matched:
+
+        2017
+        1995-1992
+        1999-09-01
+        2005-00-01
+        2021-06-00
+        2018-00-00
+
+        Returns None if the date is not one of these.
+        '''
+        length = len(date)
+        if length == 4:
+            if is_year(date):
+                return self.handlers[YearHandler].build(date, date)
+        elif length == 9:
+            first_year, second_year = date[0:4], date[5:9]
+            if date[4] in RANGE_DELIM_CHARS and is_year(first_year) and is_year(second_year):
+                return self.handlers[YearRangeHandler].build(date, first_year, second_year)
+        elif length == 10:
+            year, month, day = date[0:4], date[5:7], date[8:10]
+            if date[4] not in DELIM_CHARS or date[7] not in DELIM_CHARS or not is_year(year):
+                return None
+            if month in TWO_DIGIT_MONTHS:
+                if day in TWO_DIGIT_DATES:
+                    return self.handlers[YearMonthDayHandler].build(date, year, month, day)
+                if day == '00':
+                    return self.handlers[ZeroDayHandler].build(date, year, month)
+            elif month == '00':
+                if day in TWO_DIGIT_DATES:
+                    return self.handlers[ZeroMonthHandler].build(date, year)
+                if day == '00':
+                    return self.handlers[YearHandler].build(date, year)
+        return None
+
+
 class DateParserHandler(BaseDateHandler):
     ''' Handle dates with dateparser as a fallback to catch more date formats.
     This method is not ideal, as dateparser does not return a range of dates.
     '''
 
+    CACHE_SIZE = 8192
+    DIGIT = re.compile(r'\d')
+
     def __init__(self, unknown_date, unknown_start_date, unknown_end_date, **kwargs):
         super().__init__(unknown_date, unknown_start_date, unknown_end_date)
-        self.dateparser_kwargs = kwargs.get('dateparser_kwargs') or {}
+        self.dateparser_kwargs = self.get_dateparser_kwargs(**kwargs)
+        # Read once, so a handler created before New Year rejects dates in the new year
+        self.latest_year = datetime.date.today().year
+        # Handlers with the same dateparser_kwargs may share a cache made by create_dateparser_cache
+        self._parse_date = kwargs.get('dateparser_cache')
+        if self._parse_date is None:
+            self._parse_date = self.create_dateparser_cache(**kwargs)
+
+    @staticmethod
+    def get_dateparser_kwargs(**kwargs) -> dict:
+        ''' Get the keyword arguments for dateparser.parse from the keyword
+        arguments the handler is created with
+        '''
+        return kwargs.get('dateparser_kwargs') or {}
+
+    @classmethod
+    def create_dateparser_cache(cls, **kwargs):
+        ''' Wrap dateparser.parse in an LRU cache of its results, given the
+        keyword arguments the handler is created with. Dates that dateparser
+        could not parse are cached as None too.
+        '''
+        dateparser_kwargs = cls.get_dateparser_kwargs(**kwargs)
+        return lru_cache(maxsize=cls.CACHE_SIZE)(partial(dateparser.parse, **dateparser_kwargs))
 
     def handle(self, date: str):
         ''' dateparser.parse is slow when the date is in an unrecognizable
         format. This should be avoided at all costs to avoid a performance hit.
+        The result of parsing each date is cached, so repeated dates are only
+        parsed by dateparser once.
+
+        Dates without any digits are not given to dateparser. They cannot
+        contain a year, so dateparser could only parse them relative to today,
+        like "tomorrow" or "décembre".
         '''
-        parsed_date = dateparser.parse(date, **self.dateparser_kwargs)
-        if parsed_date is None or parsed_date.year > datetime.datetime.now().year:
+        if self.DIGIT.search(date) is None:
+            return super().handle(date)
+        parsed_date = self._parse_date(date)
+        if parsed_date is None or parsed_date.year > self.latest_year:
             return super().handle(date)
         date_ = parsed_date.date()
-        return EventDate(date_.strftime(r'%Y-%m-%d'), date_, date_)
+        return EventDate(date_.isoformat(), date_, date_)
 
 
 class YearAnywhereInDateHandler(BaseDateHandler):
@@ -704,6 +911,8 @@ class YearAnywhereInDateHandler(BaseDateHandler):
     def __init__(self, unknown_date, unknown_start_date, unknown_end_date):
         super().__init__(unknown_date, unknown_start_date, unknown_end_date)
         self.earliest_year = unknown_start_date.year
+        # Read once, so a handler created before New Year rejects dates in the new year
+        self.latest_year = datetime.date.today().year
 
     def handle(self, date: str):
         ''' If nothing else worked, try to search for a year anywhere in the
@@ -717,11 +926,10 @@ class YearAnywhereInDateHandler(BaseDateHandler):
         year = match_obj.group('year')
         year_num = int(year)
 
-        if year_num > datetime.datetime.now().year:
+        if year_num > self.latest_year:
             return super().handle(date)
         if year_num < self.earliest_year:
             return super().handle(date)
 
-        early_date = datetime.date(year_num, 1, 1)
-        late_date = datetime.date(year_num, 12, 31)
+        early_date, late_date = get_year_bounds(year_num)
         return EventDate(year, early_date, late_date)
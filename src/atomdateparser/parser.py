@@ -27,21 +27,51 @@ EventDateParser class handles parsing the dates in each of those three columns
 and returns clean, uniformly-formatted dates to be used to update each of those
 columns.
 '''
-from typing import Union, Optional
+from functools import lru_cache
+from typing import Iterable, List, Union, Optional
 import datetime
 import re
+import threading
 
 from atomdateparser.handlers import *
-from atomdateparser.stringutils import split_by, cardinality
+from atomdateparser.stringutils import split_by
 
 
 SANITIZE_DATE = re.compile(
     r'(?i)^\s*[{\[\s]*(?:ca\.?|c\.|circa|between)?\s*'
     r'(?P<sanitized>.*?)'
     r'\s*\??\s*[}\]\s]*\s*$')
+# The characters a date must start or end with for SANITIZE_DATE to change it
+SANITIZE_FIRST_CHARS = '{[cCbB'
+SANITIZE_LAST_CHARS = '}]?'
+# The words SANITIZE_DATE removes from the start of a date
+SANITIZE_PREFIX = re.compile(r'(?i)ca\.?|c\.|circa|between')
+
+
+def freeze(value):
+    ''' Get a hashable copy of a value made of dicts, lists, sets and hashable values, for use as a
+    dict key. Raises TypeError if part of the value cannot be hashed
+    '''
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    hash(value)
+    return value
 
 
 class EventDateParser:
+    CACHE_SIZE = 8192
+    # The dateparser results cached by DateParserHandler are shared by the parsers created on the
+    # same day with the same dateparser options. Only the newest MAX_DATEPARSER_CACHES are kept.
+    # A parser keeps its caches, including the dateparser one, for as long as the parser lives, so
+    # a parser kept past midnight still returns results from the day it was created
+    DATEPARSER_CACHES = {}
+    DATEPARSER_CACHES_LOCK = threading.Lock()
+    MAX_DATEPARSER_CACHES = 16
+
     def __init__(self, unknown_date: str = 'Unknown date',
                  unknown_start_date: Union[str, datetime.date] = '1800-01-01',
                  unknown_end_date: Union[str, datetime.date] = '2010-01-01',
@@ -82,26 +112,58 @@ class EventDateParser:
             self.str_unknown_start_date, self.str_unknown_end_date =\
             self.str_unknown_end_date, self.str_unknown_start_date
 
+        self.reserved_dates = frozenset((self.unknown_start_date, self.unknown_end_date))
+        self.null_or_unknown_dates = frozenset(('NULL', self.unknown_date))
+        # Copied for the trivial cases, so callers can change the dicts they get back
+        self.unknown_event_dates = {
+            'eventDates': self.unknown_date,
+            'eventStartDates': self.str_unknown_start_date,
+            'eventEndDates': self.str_unknown_end_date,
+        }
+        self.null_event_dates = {
+            'eventDates': 'NULL',
+            'eventStartDates': 'NULL',
+            'eventEndDates': 'NULL',
+        }
+
         init_vars = (self.unknown_date, self.unknown_start_date, self.unknown_end_date)
-        self.parser = UnknownDateHandler(*init_vars)
-        final_parser = self.parser.set_next(YearRangeHandler(*init_vars))\
-            .set_next(YearMonthDayHandler(*init_vars))\
-            .set_next(YearMonthRangeHandler(*init_vars))\
-            .set_next(YearMonthDayRangeHandler(*init_vars))\
-            .set_next(ZeroMonthHandler(*init_vars))\
-            .set_next(ZeroDayHandler(*init_vars))\
-            .set_next(DecadeHandler(*init_vars))\
-            .set_next(DecadeRangeHandler(*init_vars))\
-            .set_next(YearHandler(*init_vars))\
-            .set_next(SeasonHandler(*init_vars))\
-            .set_next(MonthWordYearHandler(*init_vars))\
-            .set_next(MonthWordDayYearHandler(*init_vars))\
-            .set_next(DayMonthWordYearHandler(*init_vars))\
-            .set_next(MonthWordDayYearRangeHandler(*init_vars))\
-            .set_next(DateParserHandler(*init_vars, **dateparser_kwargs)) # Special case
+        self.parser = self._create_handler_chain(init_vars, timid, dateparser_kwargs)
+
+        # Dates that could not be parsed are cached as the UnknownDateFormat they raised
+        self._parse_date = lru_cache(maxsize=self.CACHE_SIZE)(self._parse_date_uncached)
+        # Results are copied before they are returned, so callers cannot change the cached dicts
+        self._parse_event_dates = lru_cache(maxsize=self.CACHE_SIZE)(self._parse_date_group)
+
+    def _create_handler_chain(self, init_vars: tuple, timid: bool,
+                              dateparser_kwargs: dict) -> DateHandler:
+        dateparser_cache = self._get_dateparser_cache(dateparser_kwargs)
+        parser = UnknownDateHandler(*init_vars)
+        final_parser = parser.set_next(CombinedRegexHandler(*init_vars))\
+            .set_next(DateParserHandler(*init_vars, dateparser_cache=dateparser_cache,
+                                        **dateparser_kwargs)) # Special case
 
         if not timid:
             final_parser.set_next(YearAnywhereInDateHandler(*init_vars))
+        return parser
+
+    def _get_dateparser_cache(self, dateparser_kwargs: dict):
+        try:
+            # dateparser parses dates relative to today, so its results are only shared for a day
+            cache_key = (datetime.date.today(), freeze(dateparser_kwargs))
+        except TypeError:
+            # Some dateparser option cannot be hashed, so this parser gets its own cache
+            return None
+        # Parsers may be created from many threads at once
+        with self.DATEPARSER_CACHES_LOCK:
+            dateparser_cache = self.DATEPARSER_CACHES.get(cache_key)
+            if dateparser_cache is None:
+                for old_key in [key for key in self.DATEPARSER_CACHES if key[0] != cache_key[0]]:
+                    del self.DATEPARSER_CACHES[old_key]
+                if len(self.DATEPARSER_CACHES) >= self.MAX_DATEPARSER_CACHES:
+                    del self.DATEPARSER_CACHES[next(iter(self.DATEPARSER_CACHES))]
+                dateparser_cache = DateParserHandler.create_dateparser_cache(**dateparser_kwargs)
+                self.DATEPARSER_CACHES[cache_key] = dateparser_cache
+        return dateparser_cache
 
     def parse_date(self, date: str) -> EventDate:
         ''' Get parsed date range, and a clean string representation of the date. May raise an
@@ -115,15 +177,80 @@ class EventDateParser:
             eventDate (a string), and the start and end properties contain the
             date range (as datetime.dates)
         '''
+        parsed = self._parse_date(date)
+        if isinstance(parsed, UnknownDateFormat):
+            # Raise a new exception each time, so the cached one's traceback does not keep growing
+            unknown_date_format = UnknownDateFormat(*parsed.args)
+            unknown_date_format.__cause__ = parsed.__cause__
+            unknown_date_format.__context__ = parsed.__context__
+            unknown_date_format.__suppress_context__ = parsed.__suppress_context__
+            raise unknown_date_format
+        return parsed
+
+    def _parse_date_uncached(self, date: str) -> Union[EventDate, UnknownDateFormat]:
         try:
             return self.parser.handle(self._sanitize_date(date))
+        except UnknownDateFormat as exc:
+            unknown_date_format = exc
         except ValueError as exc:
-            raise UnknownDateFormat(f'{exc} for {date}') from exc
+            unknown_date_format = UnknownDateFormat(f'{exc} for {date}')
+            unknown_date_format.__cause__ = exc
+        # The tracebacks would keep the frames of the handlers, and their locals, alive in the cache
+        chained = [unknown_date_format]
+        while chained:
+            exc = chained.pop()
+            exc.__traceback__ = None
+            chained.extend(e for e in (exc.__cause__, exc.__context__) if e is not None)
+        return unknown_date_format
+
+    def parse_dates(self, dates: Iterable[str]) -> List[EventDate]:
+        ''' Get parsed date ranges for many dates at once, like a whole column of a CSV. Each
+        distinct date is only parsed once, no matter how many times it appears. May raise an
+        UnknownDateFormat exception if any of the dates could not be parsed.
+
+        Args:
+            dates (Iterable[str]): The date strings to parse
+
+        Returns:
+            (List[EventDate]): An EventDate tuple for each of the dates, in the same order
+        '''
+        # Looking repeated dates up here is about four times faster than going through the
+        # parser's cache, which still helps when dates repeat across calls
+        parsed = {}
+        event_dates = []
+        for date in dates:
+            if date not in parsed:
+                parsed[date] = self.parse_date(date)
+            event_dates.append(parsed[date])
+        return event_dates
 
     def _sanitize_date(self, date: str):
         if date is None:
             return ''
-        return SANITIZE_DATE.match(date).group('sanitized')
+        # Most dates have nothing to remove, so skip the regex. It also changes dates that start
+        # or end with whitespace, and cannot match dates containing a newline
+        if (date and date[0] not in SANITIZE_FIRST_CHARS and date[-1] not in SANITIZE_LAST_CHARS
+                and not date[0].isspace() and not date[-1].isspace() and '\n' not in date):
+            return date
+        if '\n' in date:
+            return SANITIZE_DATE.match(date).group('sanitized')
+
+        # Remove the same characters as SANITIZE_DATE with str methods, which are faster than its
+        # lazy group. Strip whitespace, braces and brackets, then the prefix
+        sanitized = date.lstrip()
+        while sanitized[:1] in ('{', '['):
+            sanitized = sanitized[1:].lstrip()
+        if sanitized[:1] in SANITIZE_FIRST_CHARS:
+            prefix = SANITIZE_PREFIX.match(sanitized)
+            if prefix:
+                sanitized = sanitized[prefix.end():].lstrip()
+        # Strip whitespace, braces and brackets from the end, then a question mark
+        sanitized = sanitized.rstrip()
+        while sanitized[-1:] in ('}', ']'):
+            sanitized = sanitized[:-1].rstrip()
+        if sanitized[-1:] == '?':
+            sanitized = sanitized[:-1].rstrip()
+        return sanitized
 
     def parse_event_dates(self, event_date: str, start_date: Optional[str] = None,
                           end_date: Optional[str] = None) -> dict:
@@ -143,37 +270,78 @@ class EventDateParser:
         start_date = start_date.strip() if start_date else ''
         end_date = end_date.strip() if end_date else ''
         all_dates = (event_date, start_date, end_date)
-        if any([cardinality(d) > 1 for d in all_dates]):
+        # The dates are stripped, so any pipe means more than one date
+        if any('|' in d for d in all_dates):
             raise ValueError('parse_event_dates does not accept pipe-delimited date cells')
         trivial_result = self._handle_trivial_cases(all_dates)
         if trivial_result:
             return trivial_result
-        return self._parse_date_group(event_date, start_date, end_date)
+        return self._parse_event_dates(event_date, start_date, end_date).copy()
+
+    def parse_event_dates_batch(self, event_dates: Iterable[str],
+                                start_dates: Optional[Iterable[str]] = None,
+                                end_dates: Optional[Iterable[str]] = None) -> List[dict]:
+        ''' Parse whole columns of dates at once, like the eventDates, eventStartDates, and
+        eventEndDates columns of a CSV. Each distinct row is only parsed once, no matter how many
+        times it appears.
+
+        Args:
+            event_dates (Iterable[str]): The eventDates, each should not include a pipe character
+            start_dates (Iterable[str]): Optional eventStartDates, one for each eventDate
+            end_dates (Iterable[str]): Optional eventEndDates, one for each eventDate
+
+        Returns:
+            (List[dict]): A dictionary for each row, in the same order, like the ones returned by
+                parse_event_dates
+        '''
+        event_dates = list(event_dates)
+        start_dates = [None] * len(event_dates) if start_dates is None else list(start_dates)
+        end_dates = [None] * len(event_dates) if end_dates is None else list(end_dates)
+        if not len(event_dates) == len(start_dates) == len(end_dates):
+            raise ValueError('parse_event_dates_batch needs the same number of each kind of date')
+
+        # Looking repeated rows up here skips stripping and checking the dates again, which is
+        # about four times faster than parse_event_dates's own cache of rows
+        parsed = {}
+        rows = []
+        for row in zip(event_dates, start_dates, end_dates):
+            if row in parsed:
+                # Each row gets its own dict, so changing one does not change the others
+                rows.append(parsed[row].copy())
+            else:
+                # parse_event_dates already returns a copy
+                parsed[row] = self.parse_event_dates(*row)
+                rows.append(parsed[row])
+        return rows
 
     def _handle_trivial_cases(self, dates):
-        if not any(dates) or dates[0] == self.unknown_date:
-            return {
-                'eventDates': self.unknown_date,
-                'eventStartDates': self.str_unknown_start_date,
-                'eventEndDates': self.str_unknown_end_date,
-            }
-        if all([x.lower() in ('', 'null') for x in dates]):
-            return {
-                'eventDates': 'NULL',
-                'eventStartDates': 'NULL',
-                'eventEndDates': 'NULL',
-            }
+        event_date, start_date, end_date = dates
+        if not (event_date or start_date or end_date) or event_date == self.unknown_date:
+            return self.unknown_event_dates.copy()
+        # Stops at the first date that is not empty or NULL, which is usually the eventDate
+        if (event_date.lower() in ('', 'null') and start_date.lower() in ('', 'null')
+                and end_date.lower() in ('', 'null')):
+            return self.null_event_dates.copy()
         return None
 
     def _parse_date_group(self, event_date: str, event_start_date: str, event_end_date: str):
-        fixed_event_dates = set() # Set of strings
-        all_start_end_dates = set() # Set of datetime.date objects
+        if event_date and ' and ' not in event_date:
+            # Most eventDates are a single date, which needs no sets to collect its dates in
+            parsed = self.parse_date(event_date)
+            fixed_event_dates = (parsed.date,)
+            if parsed.start == parsed.end:
+                all_start_end_dates = (parsed.start,)
+            else:
+                all_start_end_dates = (parsed.start, parsed.end)
+        else:
+            fixed_event_dates = set() # Set of strings
+            all_start_end_dates = set() # Set of datetime.date objects
 
-        for date in split_by(event_date, ' and '):
-            parsed = self.parse_date(date)
-            fixed_event_dates.add(parsed.date)
-            all_start_end_dates.add(parsed.start)
-            all_start_end_dates.add(parsed.end)
+            for date in split_by(event_date, ' and '):
+                parsed = self.parse_date(date)
+                fixed_event_dates.add(parsed.date)
+                all_start_end_dates.add(parsed.start)
+                all_start_end_dates.add(parsed.end)
 
         curr_min_date = self.get_min_date_avoid_reserved_dates(all_start_end_dates)
         curr_max_date = self.get_max_date_avoid_reserved_dates(all_start_end_dates)
@@ -192,7 +360,7 @@ class EventDateParser:
         if start_end_min < curr_min_date or start_end_max > curr_max_date:
             new_start_date = min(curr_min_date, start_end_min)
             new_end_date = max(curr_max_date, start_end_max)
-            date_range = '{} - {}'.format(str(new_start_date), str(new_end_date))
+            date_range = '{} - {}'.format(new_start_date, new_end_date)
             try:
                 handler = YearMonthDayRangeHandler(None, None, None)
                 parsed = handler.handle(date_range)
@@ -210,8 +378,8 @@ class EventDateParser:
 
         return {
             'eventDates': new_event_dates,
-            'eventStartDates': new_start_date.strftime(r'%Y-%m-%d'),
-            'eventEndDates': new_end_date.strftime(r'%Y-%m-%d'),
+            'eventStartDates': new_start_date.isoformat(),
+            'eventEndDates': new_end_date.isoformat(),
         }
 
     def date_is_unknown(self, start_date, end_date):
@@ -231,8 +399,7 @@ class EventDateParser:
         if len(dates) == 1:
             return next(iter(dates))
         if len(dates) > 1:
-            reserved = (self.unknown_start_date, self.unknown_end_date)
-            no_reserved_dates = list(filter(lambda d: d not in reserved, dates))
+            no_reserved_dates = [d for d in dates if d not in self.reserved_dates]
             return max_min_function(no_reserved_dates) if no_reserved_dates else default
         return default
 
@@ -248,8 +415,11 @@ class EventDateParser:
             (tuple): A tuple containing the earliest date and the latest date, in that order. May be
                 None if no dates were found or could be parsed.
         '''
-        start_end_dates = set()
-        all_dates = set([event_start_date, event_end_date])
+        start_end_dates = []
+        if event_start_date == event_end_date:
+            all_dates = (event_start_date,)
+        else:
+            all_dates = (event_start_date, event_end_date)
 
         if self.str_unknown_start_date in all_dates and self.str_unknown_end_date in all_dates:
             return None
@@ -259,8 +429,8 @@ class EventDateParser:
                 parsed = self.parse_date(date)
                 if self.date_is_unknown(parsed.start, parsed.end):
                     continue
-                start_end_dates.add(parsed.start)
-                start_end_dates.add(parsed.end)
+                start_end_dates.append(parsed.start)
+                start_end_dates.append(parsed.end)
             except UnknownDateFormat:
                 pass
 
@@ -285,7 +455,7 @@ class EventDateParser:
         end dates, the returned string will be the unknown date.
 
         Args:
-            event_dates (set): Set of eventDate strings
+            event_dates (set or tuple): The eventDate strings
             min_date (datetime.date): The earliest date represented by all the eventDates
             max_date (datetime.date): The latest date represented by all eventDates
 
@@ -294,10 +464,16 @@ class EventDateParser:
                 dates.
         '''
         new_event_dates = ''
-        non_null_event_dates = {x for x in event_dates if x not in ('NULL', self.unknown_date)}
+        if len(event_dates) == 1:
+            event_date = next(iter(event_dates))
+            if event_date not in self.null_or_unknown_dates:
+                return event_date
+            non_null_event_dates = ()
+        else:
+            non_null_event_dates = {x for x in event_dates if x not in self.null_or_unknown_dates}
 
         if non_null_event_dates:
-            new_event_dates = ' and '.join(sorted(list(non_null_event_dates)))
+            new_event_dates = ' and '.join(sorted(non_null_event_dates))
         elif self.date_is_unknown(min_date, max_date):
             new_event_dates = self.unknown_date
         elif min_date.year == max_date.year:
@@ -55,8 +55,6 @@ def cardinality(string: str) -> int:
     Returns:
         (int): The cardinality of the string
     '''
-    if string is None:
-        return 0
-    if not string.strip():
+    if not string or string.isspace():
         return 0
     return string.count('|') + 1
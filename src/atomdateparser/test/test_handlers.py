@@ -0,0 +1,81 @@
+import datetime
+
+import pytest
+
+from atomdateparser.handlers import (
+    CombinedRegexHandler, DateParserHandler, UnknownDateFormat, YearMonthDayHandler
+)
+
+
+class TestCombinedRegexHandler:
+    @pytest.mark.parametrize('date', [
+        '2017',
+        '1995-1992',
+        '1995—1996',
+        '1999-09-31',
+        '2000.02/29',
+        '2005-00-01',
+        '2021-06-00',
+        '2000-00-00',
+        '2000 to 2005',
+        '1919 - 21',
+        '1999-09-01',
+        '12/01/1984',
+        '2009-05-00 to 2010-02-00',
+        '2005/04/06 - 2005/04/08',
+        '2005-00-01',
+        '2021-06-XX',
+        'Early 190-',
+        '1930s - 1940s',
+        ' 1920s',
+        ' May 2003',
+        '2018-00-00',
+        'Spring 2002',
+        'Late May 2003',
+        'mar. 6 1994',
+        '30-jan-19',
+        'September 29, 2002 to September 30, 2002',
+    ])
+    def test_same_as_first_handler_to_match(self, date):
+        combined = CombinedRegexHandler(None, None, None)
+        for handler_class in CombinedRegexHandler.HANDLERS:
+            handler = handler_class(None, None, None)
+            if any(regex.match(date) for regex in handler.REGEXES):
+                assert combined.handle(date) == handler.handle(date)
+                break
+        else:
+            pytest.fail(f'No handler could handle "{date}"')
+
+    def test_no_match_raises(self):
+        combined = CombinedRegexHandler(None, None, None)
+        with pytest.raises(UnknownDateFormat):
+            combined.handle('not a date')
+
+
+class TestDateParserHandler:
+    def test_repeated_dates_parsed_once(self):
+        handler = DateParserHandler(None, None, None, dateparser_kwargs={'languages': ['fr']})
+        first = handler.handle('3 mai 2001')
+        second = handler.handle('3 mai 2001')
+        assert first == second
+        assert handler._parse_date.cache_info().misses == 1
+        assert handler._parse_date.cache_info().hits == 1
+
+    def test_date_without_digits_not_parsed(self):
+        handler = DateParserHandler(None, None, None, dateparser_kwargs={'languages': ['fr']})
+        with pytest.raises(UnknownDateFormat):
+            handler.handle('décembre')
+        assert handler._parse_date.cache_info().misses == 0
+
+
+class TestYearMonthDayHandler:
+    @pytest.mark.parametrize('date,expected', [
+        ('1999-09-01', datetime.date(1999, 9, 1)),
+        ('09/01/1999', datetime.date(1999, 9, 1)),
+        ('15.01.2000', datetime.date(2000, 1, 15)),
+    ])
+    def test_all_layouts(self, date, expected):
+        handler = YearMonthDayHandler(None, None, None)
+        parsed = handler.handle(date)
+        assert parsed.start == expected
+        assert parsed.end == expected
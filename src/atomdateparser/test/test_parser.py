@@ -1,5 +1,10 @@
+import datetime
+import sys
+import threading
+
 import pytest
 
+from atomdateparser.handlers import DateParserHandler, UnknownDateFormat, YearAnywhereInDateHandler
 from atomdateparser.parser import EventDateParser
 
 
@@ -187,3 +192,188 @@ class TestParseWithStartEndDatesPresent_IgnoreEventActors:
         assert parsed['eventDates'] == ed_expect
         assert parsed['eventStartDates'] == start_expect
         assert parsed['eventEndDates'] == end_expect
+
+
+class TestParseDate:
+    def test_repeated_dates_parsed_once(self):
+        parser = EventDateParser()
+        first = parser.parse_date('Spring 2002')
+        second = parser.parse_date('Spring 2002')
+        assert first is second
+        assert parser._parse_date.cache_info().misses == 1
+        assert parser._parse_date.cache_info().hits == 1
+
+    @pytest.mark.parametrize('date', [
+        'abc 12345 xyz',
+        'Feb 30, 2001',
+    ])
+    def test_repeated_unknown_dates_parsed_once(self, date):
+        parser = EventDateParser()
+        for _ in range(2):
+            with pytest.raises(UnknownDateFormat, match=date):
+                parser.parse_date(date)
+        assert parser._parse_date.cache_info().misses == 1
+        assert parser._parse_date.cache_info().hits == 1
+
+    def test_unknown_dates_cached_without_tracebacks(self):
+        parser = EventDateParser()
+        with pytest.raises(UnknownDateFormat) as exc_info:
+            parser.parse_date('Feb 30, 2001')
+        assert isinstance(exc_info.value.__cause__, ValueError)
+        cached = parser._parse_date('Feb 30, 2001')
+        assert cached.__traceback__ is None
+        assert cached.__cause__.__traceback__ is None
+
+    def test_unknown_dates_without_cause_keep_context(self):
+        parser = EventDateParser()
+        with pytest.raises(UnknownDateFormat) as exc_info:
+            parser.parse_date('abc 12345 xyz')
+        assert not exc_info.value.__suppress_context__
+
+
+class TestParseEventDates:
+    def test_repeated_rows_parsed_once(self):
+        parser = EventDateParser()
+        first = parser.parse_event_dates('March 2001', '2000-03-01', '2002-02-02')
+        second = parser.parse_event_dates(' March 2001', '2000-03-01 ', '2002-02-02')
+        assert first == second
+        assert first is not second
+        assert parser._parse_event_dates.cache_info().misses == 1
+        assert parser._parse_event_dates.cache_info().hits == 1
+
+    def test_changing_result_does_not_change_cache(self):
+        parser = EventDateParser()
+        first = parser.parse_event_dates('1999-09-01')
+        first['eventDates'] = 'changed'
+        assert parser.parse_event_dates('1999-09-01')['eventDates'] == '1999-09-01'
+
+
+class TestHandlerChains:
+    @pytest.fixture(autouse=True)
+    def empty_dateparser_caches(self, monkeypatch):
+        monkeypatch.setattr(EventDateParser, 'DATEPARSER_CACHES', {})
+
+    @staticmethod
+    def get_dateparser_handler(parser):
+        handler = parser.parser
+        while not isinstance(handler, DateParserHandler):
+            handler = handler._next_handler
+        return handler
+
+    def test_same_options_share_dateparser_cache(self):
+        first = EventDateParser(dateparser_kwargs={'languages': ['fr']})
+        second = EventDateParser(dateparser_kwargs={'languages': ['fr']})
+        assert first.parser is not second.parser
+        assert self.get_dateparser_handler(first) is not self.get_dateparser_handler(second)
+        assert self.get_dateparser_handler(first)._parse_date is \
+            self.get_dateparser_handler(second)._parse_date
+
+    def test_different_options_do_not_share_dateparser_cache(self):
+        first = EventDateParser(dateparser_kwargs={'languages': ['fr']})
+        second = EventDateParser(dateparser_kwargs={'languages': ['es']})
+        assert self.get_dateparser_handler(first)._parse_date is not \
+            self.get_dateparser_handler(second)._parse_date
+
+    def test_shared_dateparser_cache_uses_handler_options(self):
+        parser = EventDateParser(dateparser_kwargs={'languages': ['fr']})
+        handler = self.get_dateparser_handler(parser)
+        assert handler._parse_date.__wrapped__.keywords == handler.dateparser_kwargs
+
+    def test_dateparser_caches_bounded(self):
+        for day in range(1, EventDateParser.MAX_DATEPARSER_CACHES + 5):
+            EventDateParser(dateparser_kwargs={
+                'settings': {'RELATIVE_BASE': datetime.datetime(2000, 1, day)},
+            })
+        assert len(EventDateParser.DATEPARSER_CACHES) == EventDateParser.MAX_DATEPARSER_CACHES
+
+    def test_dateparser_caches_bounded_across_threads(self):
+        switch_interval = sys.getswitchinterval()
+        errors = []
+        day_delta = datetime.timedelta(days=1)
+
+        def create_parsers(year):
+            for day in range(365):
+                relative_base = datetime.datetime(year, 1, 1) + day * day_delta
+                try:
+                    EventDateParser(dateparser_kwargs={
+                        'settings': {'RELATIVE_BASE': relative_base},
+                    })
+                except Exception as exc:
+                    errors.append(exc)
+
+        threads = [threading.Thread(target=create_parsers, args=(2000 + i,)) for i in range(8)]
+        # Switch threads as often as possible, so they interleave inside _get_dateparser_cache
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+        assert not errors
+        assert len(EventDateParser.DATEPARSER_CACHES) == EventDateParser.MAX_DATEPARSER_CACHES
+
+    def test_changing_chain_does_not_change_other_parsers(self):
+        first = EventDateParser(timid=True)
+        second = EventDateParser(timid=True)
+        self.get_dateparser_handler(first).set_next(YearAnywhereInDateHandler(
+            first.unknown_date, first.unknown_start_date, first.unknown_end_date
+        ))
+        assert first.parse_date('photo taken 1999 by x').date == '1999'
+        with pytest.raises(UnknownDateFormat):
+            second.parse_date('photo taken 1999 by x')
+
+    def test_new_parser_accepts_new_year(self, monkeypatch):
+        next_year = datetime.date.today().year + 1
+        date = f'photo taken {next_year} by x'
+        first = EventDateParser()
+        with pytest.raises(UnknownDateFormat):
+            first.parse_date(date)
+
+        class NextYearDate(datetime.date):
+            @classmethod
+            def today(cls):
+                return cls(next_year, 1, 2)
+
+        monkeypatch.setattr(datetime, 'date', NextYearDate)
+        second = EventDateParser()
+        assert second.parse_date(date).start.year == next_year
+        assert self.get_dateparser_handler(first)._parse_date is not \
+            self.get_dateparser_handler(second)._parse_date
+
+
+class TestParseDates:
+    def test_parse_dates_in_order(self):
+        parser = EventDateParser()
+        parsed = parser.parse_dates(['2000', 'March 2001', '2000', '1999-09-01'])
+        assert [p.date for p in parsed] == ['2000', 'March 2001', '2000', '1999-09-01']
+        assert parsed[0] is parsed[2]
+
+    def test_parse_dates_same_as_parse_date(self):
+        parser = EventDateParser()
+        dates = ['[ca. 1990]', 'Spring 2002', '1930s - 1940s', 'n.d.']
+        assert parser.parse_dates(dates) == [parser.parse_date(d) for d in dates]
+
+
+class TestParseEventDatesBatch:
+    def test_same_as_parse_event_dates(self):
+        parser = EventDateParser()
+        event_dates = ['March 2001', '2001-03-00', 'March 2001', '']
+        start_dates = ['2000-03-01', '2001-03-15', '2000-03-01', '1906-12-21']
+        end_dates = ['2002-02-02', '2001-03-18', '2002-02-02', 'NULL']
+        parsed = parser.parse_event_dates_batch(event_dates, start_dates, end_dates)
+        assert parsed == [
+            parser.parse_event_dates(*row) for row in zip(event_dates, start_dates, end_dates)
+        ]
+        assert parsed[0] is not parsed[2]
+
+    def test_without_start_and_end_dates(self):
+        parser = EventDateParser()
+        parsed = parser.parse_event_dates_batch(['2000', 'Spring 2002'])
+        assert [p['eventDates'] for p in parsed] == ['2000', 'Spring 2002']
+
+    def test_different_lengths_raise(self):
+        parser = EventDateParser()
+        with pytest.raises(ValueError):
+            parser.parse_event_dates_batch(['2000', '2001'], ['2000-01-01'])